@@ -52,7 +52,8 @@ else:
                             "iscc_core/simhash.py",
                             "iscc_core/dct.py",
                             "iscc_core/wtahash.py",
-                        ]
+                        ],
+                        compiler_directives={"language_level": 3},
                     ),
                     cmdclass=dict(build_ext=build_ext_gracefull),
                 )
@@ -14,6 +14,7 @@ Images must be normalized before using gen_image_code. Prepare images as follows
 - Resize image to 32x32
 - Flatten 32x32 matrix to an array of 1024 grayscale (uint8) pixel values
 """
+from itertools import islice
 from statistics import median
 from typing import Sequence
 from more_itertools import chunked
@@ -75,15 +76,18 @@ def soft_hash_image_v0(pixels, bits=ic.core_opts.image_bits):
     if not bits <= 256:
         raise AssertionError(f"{bits} bits exeeds max lenght 256 for soft_hash_image")
 
+    # Low frequency 8 x 8 slices (col, row) of the dct-matrix that make up the hash
+    slices = ((0, 0), (1, 0), (0, 1), (1, 1))
+
     # DCT per row
     dct_row_lists = []
     for pixel_list in chunked(pixels, 32):
         dct_row_lists.append(ic.alg_dct(pixel_list))
 
-    # DCT per col
-    dct_row_lists_t = list(map(list, zip(*dct_row_lists)))
+    # DCT per col (only for the leftmost columns covered by the slices)
+    ncols = max(x for x, _ in slices) + 8
     dct_col_lists_t = []
-    for dct_list in dct_row_lists_t:
+    for dct_list in islice(zip(*dct_row_lists), ncols):
         dct_col_lists_t.append(ic.alg_dct(dct_list))
 
     dct_matrix = list(map(list, zip(*dct_col_lists_t)))
@@ -93,7 +97,6 @@ def soft_hash_image_v0(pixels, bits=ic.core_opts.image_bits):
         return [v for sublist in m[y : y + 8] for v in sublist[x : x + 8]]
 
     bitstring = ""
-    slices = ((0, 0), (1, 0), (0, 1), (1, 1))
 
     for xy in slices:
         # Extract 8 x 8 slice
@@ -99,8 +99,13 @@ def soft_hash_text_v0(text):
     :return: 256-bit similarity preserving byte hash.
     :rtype: bytes
     """
-    ngrams = ic.sliding_window(text, ic.core_opts.text_ngram_size)
-    features = [xxhash.xxh32_intdigest(s.encode("utf-8")) for s in ngrams]
+    width = ic.core_opts.text_ngram_size
+    if text.isascii():
+        # Windows over ASCII bytes are identical to the UTF-8 encoded character windows
+        features = list(map(xxhash.xxh32_intdigest, ic.sliding_window(text.encode("ascii"), width)))
+    else:
+        ngrams = ic.sliding_window(text, width)
+        features = [xxhash.xxh32_intdigest(s.encode("utf-8")) for s in ngrams]
     hash_digest = ic.alg_minhash_256(features)
     return hash_digest
 
@@ -131,9 +136,11 @@ def text_collapse(text):
     text = "".join(text.split()).lower()
 
     # Filter control characters, marks (diacritics), and punctuation
-    text = "".join(
-        ch for ch in text if unicodedata.category(ch)[0] not in ic.core_opts.text_unicode_filter
-    )
+    # (classify each distinct character only once)
+    unicode_filter = ic.core_opts.text_unicode_filter
+    drop = {ch for ch in set(text) if unicodedata.category(ch)[0] in unicode_filter}
+    if drop:
+        text = "".join([ch for ch in text if ch not in drop])
 
     # Recombine
     text = unicodedata.normalize("NFKC", text)
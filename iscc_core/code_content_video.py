@@ -15,10 +15,15 @@ The relevant frame signatures can be parsed from the following elements in sig.x
     It is also possible to extract the signatures in a more compact binary format.
     But the format requires a custom binary parser to decode the frame signaturs.
 """
-from typing import Sequence, Tuple
+from itertools import islice
+from typing import Collection, List, Sequence, Tuple, Union
 import iscc_core as ic
 
 
+# Rows summed per 16-bit lane before unpacking: 257 * 255 = 65535 never overflows a lane
+_LANE_ROWS = 257
+
+
 def gen_video_code(frame_sigs, bits=ic.core_opts.video_bits):
     # type: (Sequence[ic.FrameSig], int) -> dict
     """
@@ -63,9 +68,71 @@ def soft_hash_video_v0(frame_sigs, bits=ic.core_opts.video_bits):
     :param int bits: Bit-length of resulting Video-Code (multiple of 64)
     """
 
-    if not isinstance(frame_sigs[0], tuple):
-        frame_sigs = [tuple(sig) for sig in frame_sigs]
-    sigs = set(frame_sigs)
-    vecsum = [sum(col) for col in zip(*sigs)]
+    # Deduplicate frame signatures and sum them column-wise
+    sigs = dedupe_frame_sigs(frame_sigs)
+    vecsum = sum_frame_sigs(sigs)
     video_hash_digest = ic.alg_wtahash(vecsum, bits)
     return video_hash_digest
+
+
+def dedupe_frame_sigs(frame_sigs):
+    # type: (Sequence[ic.FrameSig]) -> set
+    """
+    Deduplicate frame signatures.
+
+    MP7 frame signature values fit into a single byte. Signatures given as `list` or `tuple`
+    rows of such values are deduplicated as compact `bytes` rows (one byte per value), which
+    hash much faster than tuples of integers. All other signatures (values outside of the
+    byte range or other row types like `array.array`, whose raw buffer may use several bytes
+    per value) are deduplicated as tuples.
+
+    :param ic.FrameSig frame_sigs: 2D matrix of MP7 frame signatures
+    :return: Set of unique frame signatures (as `bytes` or `tuple` rows)
+    :rtype: set
+    """
+    if all(isinstance(sig, (list, tuple)) for sig in frame_sigs):
+        try:
+            return set(map(bytes, frame_sigs))
+        except (ValueError, TypeError):
+            pass
+    return set(map(tuple, frame_sigs))
+
+
+def sum_frame_sigs(sigs):
+    # type: (Collection[Union[bytes, ic.FrameSig]]) -> List[int]
+    """
+    Sum deduplicated frame signatures column-wise.
+
+    Equally sized `bytes` rows are accumulated in 16-bit lanes of a single big integer:
+    each row is spread into a zero-padded buffer and read as one integer, so a single
+    integer addition sums all columns at once. After `_LANE_ROWS` (257) rows, the maximum
+    that fits into 16-bit lanes, the lanes are unpacked and added to the result.
+
+    !!! note
+        `bytes` rows must hold exactly one signature value per byte, as produced by
+        `dedupe_frame_sigs`. Any other rows are summed as sequences of integers.
+
+    :param Collection sigs: Deduplicated frame signatures as `bytes` or `tuple` rows
+    :return: Column sums of the frame signatures
+    :rtype: List[int]
+    """
+    rows = list(sigs)
+    ncols = len(rows[0])
+    if not all(isinstance(row, bytes) and len(row) == ncols for row in rows):
+        return list(map(sum, zip(*rows)))
+
+    vecsum = [0] * ncols
+    lanes = bytearray(2 * ncols)
+    it = iter(rows)
+    batch = list(islice(it, _LANE_ROWS))
+    while batch:
+        total = 0
+        for row in batch:
+            lanes[1::2] = row
+            total += int.from_bytes(lanes, "big")
+        # Unpack big-endian 16-bit lanes (high byte, low byte) into column sums
+        packed = total.to_bytes(2 * ncols, "big")
+        lane_sums = [high << 8 | low for high, low in zip(packed[0::2], packed[1::2])]
+        vecsum = [s + lane_sum for s, lane_sum in zip(vecsum, lane_sums)]
+        batch = list(islice(it, _LANE_ROWS))
+    return vecsum
@@ -1,8 +1,8 @@
+import re
 import unicodedata
 import jcs
-from more_itertools import interleave, sliced
 from blake3 import blake3
-from typing import Optional, Union
+from typing import Iterable, List, Match, Optional, Union
 from data_url import DataURL
 import iscc_core as ic
 
@@ -136,8 +136,7 @@ def soft_hash_meta_v0(name, extra=None):
     :rtype: bytes
     """
     name = ic.text_collapse(name)
-    name_n_grams = ic.sliding_window(name, width=ic.core_opts.meta_ngram_size_text)
-    name_hash_digests = [blake3(s.encode("utf-8")).digest() for s in name_n_grams]
+    name_hash_digests = hash_ngrams_text(name)
     simhash_digest = ic.alg_simhash(name_hash_digests)
 
     if extra in {None, "", b""}:
@@ -146,34 +145,80 @@ def soft_hash_meta_v0(name, extra=None):
         # Augment with interleaved hash for extra metadata
         if isinstance(extra, bytes):
             # Raw bytes are handled per byte
-            extra_n_grams = ic.sliding_window(extra, width=ic.core_opts.meta_ngram_size_bytes)
-            extra_hash_digests = [blake3(ngram).digest() for ngram in extra_n_grams]
+            extra_hash_digests = hash_ngrams(extra, ic.core_opts.meta_ngram_size_bytes)
         elif isinstance(extra, str):
             # Text is collapsed and handled per character (multibyte)
             extra = ic.text_collapse(extra)
-            extra_n_grams = ic.sliding_window(extra, width=ic.core_opts.meta_ngram_size_text)
-            extra_hash_digests = [blake3(s.encode("utf-8")).digest() for s in extra_n_grams]
+            extra_hash_digests = hash_ngrams_text(extra)
         else:
             raise ValueError("parameter `extra` must be of type str or bytes!")
 
         extra_simhash_digest = ic.alg_simhash(extra_hash_digests)
 
         # Interleave first half of name and extra simhashes in 32-bit chunks
-        chunks_simhash_digest = sliced(simhash_digest[:16], 4)
-        chunks_extra_simhash_digest = sliced(extra_simhash_digest[:16], 4)
-        interleaved = interleave(chunks_simhash_digest, chunks_extra_simhash_digest)
-        simhash_digest = bytearray()
-        for chunk in interleaved:
-            simhash_digest += chunk
-
-        simhash_digest = bytes(simhash_digest)
+        simhash_digest = b"".join(
+            simhash_digest[i : i + 4] + extra_simhash_digest[i : i + 4] for i in range(0, 16, 4)
+        )
 
         return simhash_digest
 
 
+def hash_ngrams(data, width):
+    # type: (bytes, int) -> List[bytes]
+    """
+    Create blake3 hash digests for all byte n-grams of `data`.
+
+    :param bytes data: Raw bytes to slide over
+    :param int width: Sliding window width in number of bytes
+    :return: List of 256-bit blake3 digests (one per n-gram)
+    :rtype: List[bytes]
+    """
+    return blake3_digests(ic.sliding_window(data, width))
+
+
+def hash_ngrams_text(text):
+    # type: (str) -> List[bytes]
+    """
+    Create blake3 hash digests for all character n-grams of `text`.
+
+    Processing units are utf-8 encoded characters (possibly multibyte). For pure ASCII text
+    character and byte offsets coincide, so we encode the text only once and slide over the
+    raw bytes instead of encoding every single n-gram.
+
+    :param str text: Collapsed text to slide over
+    :return: List of 256-bit blake3 digests (one per n-gram)
+    :rtype: List[bytes]
+    """
+    width = ic.core_opts.meta_ngram_size_text
+    if text.isascii():
+        return hash_ngrams(text.encode("ascii"), width)
+    return blake3_digests(s.encode("utf-8") for s in ic.sliding_window(text, width))
+
+
+def blake3_digests(ngrams):
+    # type: (Iterable[bytes]) -> List[bytes]
+    """
+    Create blake3 hash digests for a sequence of n-grams.
+
+    N-grams of natural text repeat a lot. We hash each distinct n-gram only once and reuse its
+    digest for all of its occurrences.
+
+    :param Iterable[bytes] ngrams: Byte n-grams to be hashed
+    :return: List of 256-bit blake3 digests (one per n-gram, in input order)
+    :rtype: List[bytes]
+    """
+    ngrams = list(ngrams)
+    digests = {ngram: blake3(ngram).digest() for ngram in set(ngrams)}
+    return [digests[ngram] for ngram in ngrams]
+
+
 def text_trim(text, nbytes):
     # type: (str, int) -> str
     """Trim text such that its utf-8 encoded size does not exceed `nbytes`."""
+    # Characters take at least one byte, so only the first `nbytes` characters can fit
+    text = text[:nbytes]
+    if text.isascii():
+        return text.strip()
     return text.encode("utf-8")[:nbytes].decode("utf-8", "ignore").strip()
 
 
@@ -206,23 +251,21 @@ def text_clean(text):
     # Unicode normalize
     text = unicodedata.normalize("NFKC", text)
 
-    # Remove control characters
-    text = "".join(
-        ch for ch in text if unicodedata.category(ch)[0] != "C" or ch in ic.core_opts.text_newlines
-    )
+    # Remove control characters (classify each distinct character only once)
+    newlines = ic.core_opts.text_newlines
+    drop = {ch for ch in set(text) if unicodedata.category(ch)[0] == "C" and ch not in newlines}
+    if drop:
+        text = "".join([ch for ch in text if ch not in drop])
 
-    # Collapse more than two consecutive newlines
-    chars = []
-    newline_count = 0
-    for c in text:
-        if c in ic.core_opts.text_newlines:
-            if newline_count < 2:
-                chars.append("\n")
-                newline_count += 1
-            continue
-        else:
-            newline_count = 0
-        chars.append(c)
-    text = "".join(chars)
+    # Collapse more than two consecutive newlines (the compiled pattern is cached by `re`)
+    if newlines:
+        pattern = "[" + re.escape("".join(sorted(newlines))) + "]+"
+        text = re.sub(pattern, collapse_newlines, text)
 
     return text.strip()
+
+
+def collapse_newlines(match):
+    # type: (Match) -> str
+    """Replace a run of newline characters with at most two line feeds."""
+    return "\n" if len(match.group()) == 1 else "\n\n"
@@ -1,11 +1,10 @@
 # -*- coding: utf-8 -*-
 import math
-import uvarint
 from typing import List, Tuple
 import base58
 from bitarray import bitarray
-from bitarray.util import int2ba, ba2int
-from base64 import b32encode, b32decode
+from bitarray.util import int2ba, ba2int, ba2base, zeros
+from base64 import b32decode
 from pybase64 import urlsafe_b64encode, urlsafe_b64decode
 from iscc_core.constants import *
 
@@ -181,6 +180,25 @@ def decode_units(unit_id):
     return tuple(MT(u) for u in units)
 
 
+def decode_uvarint(data):
+    # type: (bytes) -> int
+    """
+    Decode the unsigned varint at the start of `data` (as used for ISCC-ID counters).
+
+    :param bytes data: Bytes starting with a varint encoded unsigned integer
+    :return: Decoded integer
+    :rtype: int
+    """
+    n = 0
+    shift = 0
+    for byte in data:
+        n |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            break
+        shift += 7
+    return n
+
+
 def encode_length(mtype, length):
     # type: (MainType, Length) -> int
     """
@@ -268,7 +286,13 @@ def encode_base32(data):
     """
     Standard RFC4648 base32 encoding without padding.
     """
-    return b32encode(data).decode("ascii").rstrip("=")
+    # bitarray encodes in C while the stdlib b32encode loops over 5-byte groups in Python.
+    bits = bitarray(endian="big")
+    bits.frombytes(data)
+    pad = -len(bits) % 5
+    if pad:
+        bits.extend(zeros(pad))
+    return ba2base(32, bits)
 
 
 def decode_base32(code):
@@ -459,9 +483,9 @@ def iscc_explain(iscc):
     if fields[0] == MT.ID:
         counter_bytes = fields[-1][8:]
         if counter_bytes:
-            counter = uvarint.decode(counter_bytes)
+            counter = decode_uvarint(counter_bytes)
             hex_hash = fields[-1][:8].hex()
-            return f"{tid}-{hex_hash}-{counter.integer}"
+            return f"{tid}-{hex_hash}-{counter}"
     hex_hash = fields[-1].hex()
     return f"{tid}-{hex_hash}"
 
@@ -0,0 +1,10 @@
+import cython
+
+
+cdef dict _DCT_COS_CACHE
+
+@cython.locals(n=Py_ssize_t, half=Py_ssize_t, i=Py_ssize_t, alpha=list, beta=list, cos=list, result=list)
+cpdef list alg_dct(v)
+
+@cython.locals(i=Py_ssize_t, cos=list)
+cpdef list dct_cos(Py_ssize_t n)
@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
+# cython: boundscheck=False, wraparound=False, cdivision=True
 import math
-from typing import List, Sequence
+from typing import Callable, Dict, List, Sequence
+
+
+_DCT_COS_CACHE = {}  # type: Dict[int, List[float]]
+_DCT_UNROLLED = {}  # type: Dict[int, Callable]
 
 
 def alg_dct(v):
@@ -16,22 +21,102 @@ def alg_dct(v):
     """
 
     n = len(v)
+    unrolled = _DCT_UNROLLED.get(n)
+    if unrolled is not None:
+        return unrolled(v)
     if n == 1:
         return list(v)
     elif n == 0 or n % 2 != 0:
         raise ValueError()
     else:
         half = n // 2
-        alpha = [(v[i] + v[-(i + 1)]) for i in range(half)]
-        beta = [
-            (v[i] - v[-(i + 1)]) / (math.cos((i + 0.5) * math.pi / n) * 2.0) for i in range(half)
-        ]
+        alpha = [(v[i] + v[n - 1 - i]) for i in range(half)]
+        cos = dct_cos(n)
+        beta = [(v[i] - v[n - 1 - i]) / cos[i] for i in range(half)]
         alpha = alg_dct(alpha)
         beta = alg_dct(beta)
         result = []
         for i in range(half - 1):
             result.append(alpha[i])
             result.append(beta[i] + beta[i + 1])
-        result.append(alpha[-1])
-        result.append(beta[-1])
+        result.append(alpha[half - 1])
+        result.append(beta[half - 1])
         return result
+
+
+def dct_cos(n):
+    # type: (int) -> List[float]
+    """
+    Cosine divisors for the odd half of a DCT with input size `n`.
+
+    The values only depend on `n` and are computed once per size.
+
+    :param int n: Size of the DCT input vector.
+    :return: List of `n // 2` divisors.
+    :rtype: List
+    """
+    cos = _DCT_COS_CACHE.get(n)
+    if cos is None:
+        cos = [math.cos((i + 0.5) * math.pi / n) * 2.0 for i in range(n // 2)]
+        _DCT_COS_CACHE[n] = cos
+    return cos
+
+
+def dct_unroll(n):
+    # type: (int) -> Callable
+    """
+    Generate a specialized DCT function for input vectors of size `n`.
+
+    The recursion of `alg_dct` is partially evaluated into straight-line code with the cosine
+    divisors inlined as literals. The generated function performs exactly the same floating
+    point operations as `alg_dct` and is used by it for all inputs of size `n`.
+
+    :param int n: Size of the DCT input vector (power of 2).
+    :return: Function that computes the DCT for input vectors of size `n`.
+    :rtype: Callable
+    """
+    if n < 2 or n & (n - 1):
+        raise ValueError(f"DCT size must be a power of 2 and at least 2 (got {n})")
+    names = [f"v{i}" for i in range(n)]
+    lines = []  # type: List[str]
+    result = _dct_unroll(names, lines)
+    source = "\n    ".join(
+        [f"def dct_{n}(v):", ", ".join(names) + " = v"] + lines + [f"return [{', '.join(result)}]"]
+    )
+    namespace = {}  # type: Dict[str, Callable]
+    exec(compile(source, f"<dct_{n}>", "exec"), namespace)  # nosec
+    _DCT_UNROLLED[n] = namespace[f"dct_{n}"]
+    return _DCT_UNROLLED[n]
+
+
+def _dct_unroll(names, lines):
+    # type: (List[str], List[str]) -> List[str]
+    """Emit assignments for the DCT of the variables in `names` and return the result names."""
+    n = len(names)
+    if n == 1:
+        return names
+    half = n // 2
+    cos = dct_cos(n)
+    alpha = []
+    beta = []
+    for i in range(half):
+        alpha.append(f"t{len(lines)}")
+        lines.append(f"{alpha[i]} = {names[i]} + {names[n - 1 - i]}")
+    for i in range(half):
+        beta.append(f"t{len(lines)}")
+        lines.append(f"{beta[i]} = ({names[i]} - {names[n - 1 - i]}) / {cos[i]!r}")
+    alpha = _dct_unroll(alpha, lines)
+    beta = _dct_unroll(beta, lines)
+    result = []
+    for i in range(half - 1):
+        name = f"t{len(lines)}"
+        lines.append(f"{name} = {beta[i]} + {beta[i + 1]}")
+        result.append(alpha[i])
+        result.append(name)
+    result.append(alpha[half - 1])
+    result.append(beta[half - 1])
+    return result
+
+
+# Image-Code DCTs operate on 32 x 32 pixel matrices
+dct_unroll(32)
@@ -11,6 +11,8 @@ def alg_minhash(features):
     :return: Minhash vector
     :rtype: List[int]
     """
+    # Duplicate features cannot change a minimum, so only permute distinct features.
+    features = list(set(features))
     return [
         min([(((a * f + b) & MAXI64) % MPRIME) & MAXH for f in features]) for a, b in zip(MPA, MPB)
     ]
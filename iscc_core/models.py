@@ -4,9 +4,7 @@ import datetime
 import random
 from typing import List, Union
 import base58
-import uvarint
 from bitarray import bitarray, frozenbitarray
-from bitarray.util import ba2hex, ba2int, count_xor
 
 from iscc_core import core_opts
 from iscc_core.constants import IsccAny, UNITS, LN, MT, ST, ST_CC, ST_ID, ST_ISCC, VS, MC_PREFIX
@@ -17,6 +15,7 @@ from iscc_core.codec import (
     decode_base32,
     decode_length,
     decode_units,
+    decode_uvarint,
     encode_base32,
     encode_base64,
     encode_length,
@@ -34,11 +33,35 @@ __all__ = [
 ]
 
 
+if sys.version_info >= (3, 10):
+    _popcount = int.bit_count
+else:  # pragma: no cover
+
+    def _popcount(n):
+        # type: (int) -> int
+        return bin(n).count("1")
+
+
 class Code:
     """
     Convenience class to handle different representations of an ISCC.
     """
 
+    __slots__ = (
+        "_head",
+        "_body",
+        "_uint",
+        "_hash_bytes",
+        "_header_bytes",
+        "_bytes",
+        "_code",
+        "_type_id",
+        "_maintype",
+        "_subtype",
+        "_version",
+        "_length",
+    )
+
     def __init__(self, code):
         # type: (IsccAny) -> None
         """
@@ -48,6 +71,16 @@ class Code:
         """
         self._head = None
         self._body = None
+        self._uint = None
+        self._hash_bytes = None
+        self._header_bytes = None
+        self._bytes = None
+        self._code = None
+        self._type_id = None
+        self._maintype = None
+        self._subtype = None
+        self._version = None
+        self._length = None
 
         if isinstance(code, Code):
             code_fields = code._head + (code.hash_bytes,)
@@ -62,9 +95,8 @@ class Code:
             raise ValueError(f"Code must be str, bytes, tuple or Code not {type(code)}")
 
         self._head = code_fields[:-1]
-        body = bitarray()
-        body.frombytes(code_fields[-1])
-        self._body = frozenbitarray(body)
+        self._hash_bytes = bytes(code_fields[-1])
+        self._uint = int.from_bytes(self._hash_bytes, "big", signed=False)
 
     def __str__(self):
         return self.code
@@ -83,7 +115,9 @@ class Code:
     @property
     def code(self) -> str:
         """Standard base32 representation of an ISCC code."""
-        return encode_base32(self.bytes)
+        if self._code is None:
+            self._code = encode_base32(self.bytes)
+        return self._code
 
     @property
     def uri(self) -> str:
@@ -93,7 +127,9 @@ class Code:
     @property
     def bytes(self) -> bytes:
         """Raw bytes of code (including header)."""
-        return self.header_bytes + self._body.tobytes()
+        if self._bytes is None:
+            self._bytes = self.header_bytes + self._hash_bytes
+        return self._bytes
 
     @property
     def hex(self) -> str:
@@ -113,12 +149,14 @@ class Code:
     @property
     def type_id(self) -> str:
         """A unique composite type-id (use as name to index codes seperately)."""
-        if self.maintype == MT.ISCC:
-            mtypes = decode_units(self._head[3])
-            length = "".join([t.name[0] for t in mtypes]) + "DI"
-        else:
-            length = self.length
-        return f"{self.maintype.name}-" f"{self.subtype.name}-" f"{self.version.name}-" f"{length}"
+        if self._type_id is None:
+            if self.maintype == MT.ISCC:
+                mtypes = decode_units(self._head[3])
+                length = "".join([t.name[0] for t in mtypes]) + "DI"
+            else:
+                length = self.length
+            self._type_id = f"{self.maintype.name}-{self.subtype.name}-{self.version.name}-{length}"
+        return self._type_id
 
     @property
     def explain(self) -> str:
@@ -126,19 +164,19 @@ class Code:
         if self.maintype == MT.ID:
             counter_bytes = self.hash_bytes[8:]
             if counter_bytes:
-                counter = uvarint.decode(counter_bytes)
-                return f"{self.type_id}-{self.hash_bytes[:8].hex()}-{counter.integer}"
+                counter = decode_uvarint(counter_bytes)
+                return f"{self.type_id}-{self.hash_bytes[:8].hex()}-{counter}"
         return f"{self.type_id}-{self.hash_hex}"
 
     @property
     def hash_bytes(self) -> bytes:
         """Byte representation of code (without header)"""
-        return self._body.tobytes()
+        return self._hash_bytes
 
     @property
     def hash_hex(self) -> str:
         """Hex string representation of code (without header)."""
-        return ba2hex(self._body)
+        return self._hash_bytes.hex()
 
     @property
     def hash_base32(self) -> str:
@@ -153,53 +191,68 @@ class Code:
     @property
     def hash_bits(self) -> str:
         """String of 0,1 representing the bits of the code (without header)."""
-        return self._body.to01()
+        return self.hash_ba.to01()
 
     @property
     def hash_ints(self) -> List[int]:
         """List of 0,1 integers representing the bits of the code (without header)."""
-        return self._body.tolist()
+        return self.hash_ba.tolist()
 
     @property
     def hash_uint(self) -> int:
         """Unsinged integer representation of the code (without header)."""
-        return ba2int(self._body, signed=False)
+        return self._uint
 
     @property
     def hash_ba(self) -> frozenbitarray:
         """Bitarray object of the code (without header)."""
+        if self._body is None:
+            body = bitarray()
+            body.frombytes(self._hash_bytes)
+            self._body = frozenbitarray(body)
         return self._body
 
     @property
     def header_bytes(self) -> bytes:
         """Byte representation of header prefix of the code"""
-        return encode_header(*self._head)
+        if self._header_bytes is None:
+            self._header_bytes = encode_header(*self._head)
+        return self._header_bytes
 
     @property
     def maintype(self) -> MT:
         """Enum maintype of code."""
-        return MT(self._head[0])
+        if self._maintype is None:
+            self._maintype = MT(self._head[0])
+        return self._maintype
 
     @property
     def subtype(self) -> Union[ST, ST_CC, ST_ISCC, ST_ID]:
         """Enum subtype of code."""
-        if self.maintype in (MT.CONTENT, MT.SEMANTIC):
-            return ST_CC(self._head[1])
-        elif self.maintype == MT.ISCC:
-            return ST_ISCC(self._head[1])
-        elif self.maintype == MT.ID:
-            return ST_ID(self._head[1])
-        return ST(self._head[1])
+        if self._subtype is None:
+            if self.maintype in (MT.CONTENT, MT.SEMANTIC):
+                self._subtype = ST_CC(self._head[1])
+            elif self.maintype == MT.ISCC:
+                self._subtype = ST_ISCC(self._head[1])
+            elif self.maintype == MT.ID:
+                self._subtype = ST_ID(self._head[1])
+            else:
+                self._subtype = ST(self._head[1])
+        return self._subtype
 
     @property
     def version(self) -> VS:
         """Enum version of code."""
-        return VS(self._head[2])
+        if self._version is None:
+            self._version = VS(self._head[2])
+        return self._version
 
     @property
     def length(self) -> int:
         """Length of code hash in number of bits (without header)."""
-        return decode_length(self._head[0], self._head[3])
+        if self._length is None:
+            self._length = decode_length(self._head[0], self._head[3])
+        return self._length
 
     rgen = random.Random(0)  # nosec
 
@@ -291,7 +344,9 @@ class Code:
 
     def __xor__(self, other) -> int:
         """Use XOR operator for hamming distance calculation."""
-        return count_xor(self._body, other._body)
+        if len(self._hash_bytes) != len(other._hash_bytes):
+            raise ValueError(f"Hash digests of unequal length: {self.length} vs {other.length}")
+        return _popcount(self._uint ^ other._uint)
 
     def __eq__(self, other):
         # type: (Code) -> bool
@@ -304,6 +359,8 @@ class Code:
 class Flake:
     """Unique lexicographically k-sortable identifier"""
 
+    __slots__ = ("_flake", "_bits")
+
     def __init__(self, ts=None, bits=core_opts.flake_bits):
         self._flake = uid_flake_v0(ts, bits=bits)
         self._bits = bits
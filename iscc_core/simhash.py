@@ -7,6 +7,9 @@ def alg_simhash(hash_digests):
     """
     Creates a similarity preserving hash from a sequence of equal sized hash digests.
 
+    All digests are concatenated into a single bitarray. The column sum for each bit
+    position is then counted in one pass over a strided slice of that bitarray.
+
     :param list hash_digests: A sequence of equaly sized byte-hashes.
     :returns: Similarity byte-hash
     :rtype: bytes
@@ -14,19 +17,10 @@ def alg_simhash(hash_digests):
 
     n_bytes = len(hash_digests[0])
     n_bits = n_bytes * 8
-    vector = [0] * n_bits
-
-    for digest in hash_digests:
-        h = bitarray()
-        h.frombytes(digest)
-        for i in range(n_bits):
-            vector[i] += h[i]
+    bits = bitarray()
+    bits.frombytes(b"".join(hash_digests))
 
     minfeatures = len(hash_digests) / 2
-    shash = 0
-
-    for i in range(n_bits):
-        if vector[i] >= minfeatures:
-            shash |= 1 << (n_bits - 1 - i)
+    shash = bitarray([bits[i::n_bits].count() >= minfeatures for i in range(n_bits)])
 
-    return shash.to_bytes(n_bytes, "big")
+    return shash.tobytes()
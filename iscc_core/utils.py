@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-import io
 import json
 from hashlib import sha256
 from typing import Generator, Sequence, Tuple, Any
@@ -11,6 +10,9 @@ import iscc_core as ic
 import jcs
 from iscc_core.constants import Stream
 
+# multibase (f = base16), cidv1 (0x01), raw (0x55), sha2-256 (0x12), length (varint 32 = 0x20)
+CIDV1_HEX_PREFIX = "f" + (b"\x01\x55\x12" + uvarint.encode(32)).hex()
+
 
 __all__ = [
     "json_canonical",
@@ -90,37 +92,23 @@ def cidv1_hex(stream):
     :rtype: str
     """
 
-    if isinstance(stream, bytes):
-        stream = io.BytesIO(stream)
-
     ipfs_max_size = 262144
-    data = stream.read(ipfs_max_size)
+
+    if isinstance(stream, bytes):
+        # hash raw bytes directly without copying them through a stream
+        data = stream
+        oversized = len(data) > ipfs_max_size
+    else:
+        data = stream.read(ipfs_max_size)
+        oversized = bool(stream.read(1))
 
     # fail if we have more data than ipfs_max_size
-    if stream.read(1):
+    if oversized:
         raise ValueError(
             f"Data exceeds current max size {ipfs_max_size} for ipfs_hash: {len(data)}"
         )
 
-    digest = sha256(data).digest()
-    multibase_prefix = "f"
-    multicodec_cidv1 = b"\x01"
-    multicodec_content_type = b"\x55"  # raw
-    multicodec_mutihash_type = b"\x12"  # sha2-256
-    multicodec_mutihash_len = uvarint.encode(32)  # 28 byte length (varint encoded 0x1c)
-
-    cid_v1_digest = b"".join(
-        (
-            multicodec_cidv1,
-            multicodec_content_type,
-            multicodec_mutihash_type,
-            multicodec_mutihash_len,
-            digest,
-        )
-    )
-
-    cid_v1 = multibase_prefix + cid_v1_digest.hex()
-    return cid_v1
+    return CIDV1_HEX_PREFIX + sha256(data).hexdigest()
 
 
 def cidv1_to_token_id(cidv1):
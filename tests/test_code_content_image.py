@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import math
 import pytest
 import iscc_core as ic
 
@@ -85,6 +86,31 @@ def test_dct_range():
     assert ic.alg_dct(range(64))[0] == 2016
 
 
+def test_dct_cos_cached():
+    cos = ic.dct_cos(32)
+    assert len(cos) == 16
+    assert cos[0] == math.cos(0.5 * math.pi / 32) * 2.0
+    assert ic.dct_cos(32) is cos
+
+
+def test_dct_single():
+    assert ic.alg_dct([5]) == [5]
+
+
+def test_dct_unroll_matches_recursion(monkeypatch):
+    for n in (8, 32):
+        # Run against an empty, test-local cache so alg_dct falls back to the recursion
+        monkeypatch.setattr(ic.dct, "_DCT_UNROLLED", {})
+        v = [float(p) for p in IMG_SAMPLE_PIXELS[:n]]
+        expected = ic.alg_dct(v)
+        assert ic.dct_unroll(n)(v) == expected
+
+
+def test_dct_unroll_raises():
+    with pytest.raises(ValueError):
+        ic.dct_unroll(12)
+
+
 def test_gen_image_code_schema_conformance():
     iscc_obj = ic.gen_image_code_v0(IMG_SAMPLE_PIXELS)
     assert iscc_obj == {"iscc": "ISCC:EEA4GQZQTY6J5DTH"}
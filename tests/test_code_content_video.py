@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import random
+from array import array
 import iscc_core
 
 
@@ -64,3 +66,47 @@ def test_gen_video_code_schema_confromance():
     frame_vectors = [fa, fb]
     iscc_obj = iscc_core.gen_video_code_v0(frame_vectors)
     assert iscc_obj == {"iscc": "ISCC:EMAZEMGSDFIB4AHU"}
+
+
+def test_hash_video_v0_list_and_duplicate_framevectors():
+    fa = [0, 1, 0, 2, 1] * 76
+    fb = [1, 2, 1, 0, 2] * 76
+    frame_vectors = [fa, fb, list(fa), tuple(fb)]
+    assert (
+        iscc_core.code_content_video.soft_hash_video_v0(frame_vectors, bits=256).hex()
+        == "9230d219501e00f42664b4bd206b000c98488635b0b03c010010ee00aaf93e43"
+    )
+
+
+def test_dedupe_frame_sigs():
+    fa = [0, 1, 0, 2, 1] * 76
+    fb = [1, 2, 1, 0, 2] * 76
+    assert iscc_core.dedupe_frame_sigs([fa, fb, tuple(fa)]) == {bytes(fa), bytes(fb)}
+    wide = tuple(range(380))
+    assert iscc_core.dedupe_frame_sigs([wide, list(wide)]) == {wide}
+
+
+def test_dedupe_frame_sigs_buffer_rows():
+    fa = [0, 1, 0, 2, 1] * 76
+    fb = [1, 2, 1, 0, 2] * 76
+    sigs = [array("i", fa), array("i", fb), array("i", fa)]
+    assert iscc_core.dedupe_frame_sigs(sigs) == {tuple(fa), tuple(fb)}
+    assert iscc_core.soft_hash_video_v0(sigs, 64).hex() == "9230d219501e00f4"
+
+
+def test_sum_frame_sigs():
+    rgen = random.Random(0)
+    sigs = {bytes(rgen.choice((0, 1, 2, 255)) for _ in range(380)) for _ in range(600)}
+    expected = [sum(col) for col in zip(*sigs)]
+    assert iscc_core.sum_frame_sigs(sigs) == expected
+    assert iscc_core.sum_frame_sigs({tuple(sig) for sig in sigs}) == expected
+    assert iscc_core.sum_frame_sigs([b"\x01\x02", b"\x03"]) == [4]
+
+
+def test_hash_video_v0_sequence_rows():
+    fa = [0, 1, 0, 2, 1] * 76
+    fb = [1, 2, 1, 0, 2] * 76
+    expected = "9230d219501e00f4"
+    for rtype in (lambda v: array("i", v), lambda v: array("B", v), bytes, bytearray):
+        frame_vectors = [rtype(fa), rtype(fb)]
+        assert iscc_core.soft_hash_video_v0(frame_vectors, 64).hex() == expected
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import pytest
+from blake3 import blake3
 import iscc_core as ic
+from iscc_core.code_meta import blake3_digests, hash_ngrams_text
 
 
 def test_gen_meta_code_name_none():
@@ -87,6 +89,19 @@ def test_hash_meta_v0_interleaved():
     assert ma[4:8] == mb[8:12]
 
 
+def test_hash_ngrams_text_ascii_matches_per_char():
+    for text in ("helloworld", "iñtërnâtiônàlizætiøn☃💩", "ab", ""):
+        ngrams = ic.sliding_window(text, ic.core_opts.meta_ngram_size_text)
+        expected = [blake3(s.encode("utf-8")).digest() for s in ngrams]
+        assert hash_ngrams_text(text) == expected
+
+
+def test_blake3_digests_repeated_ngrams():
+    ngrams = [b"abc", b"bca", b"abc", b"abc"]
+    assert blake3_digests(ngrams) == [blake3(ngram).digest() for ngram in ngrams]
+    assert blake3_digests(iter(ngrams)) == blake3_digests(ngrams)
+
+
 def test_gen_meta_code_v0_interleaved():
     ma = ic.gen_meta_code_v0("Hello")
     mb = ic.gen_meta_code_v0("Hello", "World")
@@ -125,6 +140,14 @@ def test_trim_text():
     assert 128 == len(trimmed.encode("utf-8"))
 
 
+def test_trim_text_long_and_ascii():
+    text = "Iñtërnâtiônàlizætiøn☃💩 " * 1000
+    for nbytes in (1, 2, 3, 4, 127, 128, 4096):
+        expected = text.encode("utf-8")[:nbytes].decode("utf-8", "ignore").strip()
+        assert ic.text_trim(text, nbytes) == expected
+    assert ic.text_trim(" Hello World " * 100, 12) == "Hello World"
+
+
 def test_clean_text_lead_trail():
     assert ic.text_clean(" Hello World! ") == "Hello World!"
 
@@ -168,6 +191,26 @@ More Text
     )
 
 
+def test_clean_text_control_chars():
+    assert ic.text_clean("\x00Hello\u200b\tWorld\x7f!\r\n\x1b") == "HelloWorld!"
+
+
+def test_clean_text_collapse_newlines():
+    assert ic.text_clean("a\r\nb\n\n\n\nc\u2028\u2029\x85d\ve") == "a\n\nb\n\nc\n\nd\ne"
+
+
+def test_clean_text_newlines_option_empty_and_plain_set():
+    newlines = ic.core_opts.text_newlines
+    try:
+        ic.core_opts.text_newlines = frozenset()
+        assert ic.text_clean("a\r\n\n\nb") == "ab"
+        ic.core_opts.text_newlines = {"\n"}
+        assert ic.text_clean("a\r\n\n\nb\nc") == "a\n\nb\nc"
+        assert ic.gen_meta_code("Hello", "a\n\n\nb")["description"] == "a\n\nb"
+    finally:
+        ic.core_opts.text_newlines = newlines
+
+
 def test_remove_newlines():
     txt = "   Hello\nWorld!  - How Are you   "
     exp = "Hello World! - How Are you"
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 import os
+from base64 import b32encode
 from binascii import unhexlify
 import pytest
+import uvarint
 from bitarray import bitarray as ba, frozenbitarray
 import iscc_core as ic
 
@@ -41,6 +43,12 @@ def test_encode_base32():
     assert ic.encode_base32(b"foobar") == "MZXW6YTBOI"
 
 
+def test_encode_base32_matches_stdlib():
+    for n in range(48):
+        data = os.urandom(n)
+        assert ic.encode_base32(data) == b32encode(data).decode("ascii").rstrip("=")
+
+
 def test_decode_base32():
     assert ic.decode_base32("") == b""
     assert ic.decode_base32("MY") == b"f"
@@ -653,3 +661,18 @@ def test_iscc_validate_mscdi():
     with pytest.raises(ValueError) as excinfo:
         ic.iscc_validate(sample + "A", strict=True)
     assert str(excinfo.value) == "ISCC string does not match ^ISCC:[A-Z2-7]{10,68}$"
+
+
+def test_code_xor_hamming_distance():
+    for bits in (64, 128, 256):
+        a = ic.Code.rnd(mt=ic.MT.CONTENT, bits=bits, data=os.urandom(bits // 8))
+        b = ic.Code((a.maintype, a.subtype, a.version, a._head[3], os.urandom(bits // 8)))
+        assert a ^ b == ic.iscc_distance_bytes(a.hash_bytes, b.hash_bytes)
+        assert b ^ a == a ^ b
+
+
+def test_decode_uvarint():
+    for n in (0, 1, 127, 128, 255, 300, 16383, 16384, 2**32, 2**53):
+        data = uvarint.encode(n)
+        assert ic.decode_uvarint(data) == uvarint.decode(data).integer == n
+    assert ic.decode_uvarint(uvarint.encode(300) + b"\xff") == 300
@@ -16,6 +16,11 @@ def test_minhash_single_feature():
     assert mh[-1] == 2739100501
 
 
+def test_minhash_duplicate_features():
+    features = [2**16, 7, 2**32 - 1, 42]
+    assert ic.alg_minhash(features * 3 + [7, 7]) == ic.alg_minhash(features)
+
+
 def test_minhash_32bit_features():
     i32 = 2**32 - 1
     mh = ic.alg_minhash([2**64 - 1])
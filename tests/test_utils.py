@@ -117,6 +117,7 @@ def test_hash_ipfs_cidv1_max(static_bytes):
         ic.cidv1_hex(io.BytesIO(data))
         == "f01551220dd8186a3d57826d3179717fbcaef8e4c24c5380f0ee7d869f41f727015fe17ab"
     )
+    assert ic.cidv1_hex(data) == ic.cidv1_hex(io.BytesIO(data))
 
 
 def test_cidv1_to_token_id():
@@ -153,6 +154,8 @@ def test_hash_ipfs_cidv1_raises(static_bytes):
     data = static_bytes[:262145]
     with pytest.raises(ValueError):
         ic.cidv1_hex(io.BytesIO(data))
+    with pytest.raises(ValueError):
+        ic.cidv1_hex(data)
 
 
 def test_canonicalize():